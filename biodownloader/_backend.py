@@ -0,0 +1,68 @@
+"""
+Column storage backend for the returned tables.
+
+"pyarrow" stores text as Arrow strings (and low-cardinality GEO fields as
+categoricals), which is much smaller than Python objects. "numpy" keeps the
+classic object/NumPy columns for code that needs them.
+"""
+
+from __future__ import annotations
+
+from typing import Optional
+
+import pandas as pd
+from pandas.api.types import is_string_dtype
+
+try:  # Arrow-backed columns need pyarrow
+    import pyarrow as pa
+    HAVE_PYARROW = True
+except ImportError:  # pragma: no cover - pyarrow is an optional extra
+    pa = None
+    HAVE_PYARROW = False
+
+
+BACKENDS = ("pyarrow", "numpy")
+
+# pandas.read_csv's default missing-value strings, handed to polars so both
+# parsers return NaN for the same cells
+PANDAS_NA_VALUES = [
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None",
+    "n/a", "nan", "null",
+]
+
+
+def resolve_backend(backend: Optional[str]) -> str:
+    """Map None to the best available backend and validate explicit choices."""
+    if backend is None:
+        return "pyarrow" if HAVE_PYARROW else "numpy"
+    if backend not in BACKENDS:
+        raise ValueError(f"backend must be one of {BACKENDS}, got: {backend!r}")
+    if backend == "pyarrow" and not HAVE_PYARROW:
+        raise ImportError("backend='pyarrow' requires the 'pyarrow' package.")
+    return backend
+
+
+def normalize_frame(df: pd.DataFrame, backend: str) -> pd.DataFrame:
+    """
+    Give `df` the column dtypes promised by `backend`, whatever produced it.
+
+    The pandas pyarrow engine, polars and a Parquet cache round-trip each
+    hand back slightly different Arrow string types (string, large_string,
+    StringDtype); with "pyarrow" every text column ends up as the same
+    ArrowDtype(pa.string()). Categoricals are left alone.
+    """
+    if backend != "pyarrow":
+        return df
+
+    df = df.convert_dtypes(dtype_backend="pyarrow")
+    arrow_string = pd.ArrowDtype(pa.string())
+    text_columns = {
+        col: arrow_string
+        for col, dtype in df.dtypes.items()
+        if dtype != object
+        and not isinstance(dtype, pd.CategoricalDtype)
+        and is_string_dtype(dtype)
+        and dtype != arrow_string
+    }
+    return df.astype(text_columns) if text_columns else df
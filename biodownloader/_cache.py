@@ -0,0 +1,71 @@
+"""
+Small on-disk cache for parsed metadata tables.
+
+Archive metadata is effectively read-only, so repeated lookups of the same
+accession are served from a local file instead of re-querying GEO / SRA / ENA.
+Tables are stored as Parquet; without pyarrow the cache is simply disabled.
+"""
+
+from __future__ import annotations
+
+import hashlib
+import os
+import time
+from pathlib import Path
+from typing import Mapping, Optional
+
+import pandas as pd
+
+from biodownloader._backend import HAVE_PYARROW
+
+# Where cached tables live; override with BIODOWNLOADER_CACHE_DIR.
+CACHE_DIR = Path(
+    os.environ.get("BIODOWNLOADER_CACHE_DIR", "~/.cache/biodownloader")
+).expanduser()
+
+# Entries older than this (in seconds) are ignored and re-fetched.
+CACHE_EXPIRE_AFTER = 86400
+
+
+def cache_key(url: str, params: Optional[Mapping[str, object]] = None) -> str:
+    """Hash an endpoint and its query parameters into a stable file name."""
+    h = hashlib.blake2b(url.encode("utf-8"), digest_size=16)
+    for name, value in sorted((params or {}).items()):
+        h.update(f"\0{name}={value}".encode("utf-8"))
+    return h.hexdigest()
+
+
+def _cache_path(key: str) -> Path:
+    return CACHE_DIR / (key + ".parquet")
+
+
+def load_frame(key: str) -> Optional[pd.DataFrame]:
+    """Return the cached table for `key`, or None if missing or expired."""
+    if not HAVE_PYARROW:
+        return None
+
+    path = _cache_path(key)
+    try:
+        if time.time() - path.stat().st_mtime > CACHE_EXPIRE_AFTER:
+            return None
+        return pd.read_parquet(path)
+    except Exception:
+        # missing, unreadable or corrupt entries just count as a miss
+        return None
+
+
+def store_frame(key: str, df: pd.DataFrame) -> None:
+    """Write `df` to the cache; failures are ignored (caching is best-effort)."""
+    # "nothing found" may be transient or a not-yet-released accession, so never pin it
+    if not HAVE_PYARROW or df.empty:
+        return
+
+    path = _cache_path(key)
+    tmp = path.with_name(f"{path.name}.{os.getpid()}.tmp")
+    try:
+        path.parent.mkdir(parents=True, exist_ok=True)
+        df.to_parquet(tmp, index=False)
+        # atomic rename so concurrent readers never see a half-written file
+        os.replace(tmp, path)
+    except Exception:
+        tmp.unlink(missing_ok=True)
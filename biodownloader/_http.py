@@ -0,0 +1,92 @@
+"""
+Shared HTTP session used by all fetchers.
+
+Reusing one pooled session keeps TCP/TLS connections to NCBI and EBI alive
+across calls, and retries transient server errors with a short backoff.
+The fetchers only issue plain GETs that never touch cookies, auth or other
+session state, and urllib3's connection pool is thread-safe, so the GEO/SRA
+workers of fetch_and_merge_geo_sra share this one session as well.
+"""
+
+from __future__ import annotations
+
+import io
+import shutil
+import tempfile
+from contextlib import contextmanager
+from typing import BinaryIO, Iterator, Optional
+
+import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
+
+
+def _build_session() -> requests.Session:
+    retry = Retry(
+        total=3,
+        backoff_factor=0.3,
+        status_forcelist=(429, 500, 502, 503, 504),
+        allowed_methods=("GET",),
+        # hand the final response back so callers' raise_for_status() still applies
+        raise_on_status=False,
+    )
+    adapter = HTTPAdapter(pool_connections=4, pool_maxsize=8, max_retries=retry)
+
+    session = requests.Session()
+    session.mount("https://", adapter)
+    session.mount("http://", adapter)
+    return session
+
+
+SESSION = _build_session()
+
+# decoded bodies up to this size are kept in memory; larger ones go to a temp file
+SPOOL_THRESHOLD = 32 << 20
+
+
+@contextmanager
+def open_body(resp: requests.Response) -> Iterator[Optional[BinaryIO]]:
+    """
+    Yield the decoded body of a streamed response as a binary file object.
+
+    An uncompressed body whose Content-Length is within SPOOL_THRESHOLD is
+    read straight off the socket in a single pass. Anything else (compressed,
+    where Content-Length is the wire size, or of unknown size, as with chunked
+    ENA/efetch replies) is first copied into a SpooledTemporaryFile. That copy
+    costs one extra pass, but it is sized on the decoded bytes: it stays in
+    memory up to SPOOL_THRESHOLD and rolls over to disk beyond that, so a
+    large body is never held in memory alongside the parsed table.
+    Yields None if the body is empty or whitespace only.
+    """
+    resp.raw.decode_content = True
+    resp.raw.auto_close = False  # keep the stream readable until the parser is done
+
+    length = resp.headers.get("Content-Length")
+    encoding = resp.headers.get("Content-Encoding", "identity").lower()
+    if (
+        encoding == "identity"
+        and length is not None
+        and length.isdigit()
+        and int(length) <= SPOOL_THRESHOLD
+    ):
+        body = io.BufferedReader(resp.raw)
+        yield body if _skip_blank(body) else None
+        return
+
+    with tempfile.SpooledTemporaryFile(max_size=SPOOL_THRESHOLD, mode="w+b") as tmp:
+        shutil.copyfileobj(resp.raw, tmp, 1 << 20)
+        tmp.seek(0)
+        blank = not any(chunk.strip() for chunk in iter(lambda: tmp.read(1 << 20), b""))
+        tmp.seek(0)
+        yield None if blank else tmp
+
+
+def _skip_blank(body: io.BufferedReader) -> bool:
+    """Consume buffered runs of pure whitespace; False if nothing else follows."""
+    while True:
+        chunk = body.peek(1)
+        if not chunk:
+            return False
+        if chunk.strip():
+            return True
+        body.read(len(chunk))
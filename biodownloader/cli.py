@@ -1,6 +1,7 @@
 import argparse
 import sys
 
+from ._backend import HAVE_PYARROW
 from .geo import fetch_geo_series
 from .sra import fetch_sra_bioproject
 from .ena import fetch_ena_accession
@@ -9,7 +10,7 @@ from .ena import fetch_ena_accession
 def build_parser() -> argparse.ArgumentParser:
     parser = argparse.ArgumentParser(
         prog="biofetch",
-        description="Fetch GEO / SRA / ENA metadata and export as CSV."
+        description="Fetch GEO / SRA / ENA metadata and export as CSV or Parquet."
     )
 
     parser.add_argument(
@@ -28,7 +29,14 @@ def build_parser() -> argparse.ArgumentParser:
     parser.add_argument(
         "--out",
         default=None,
-        help="Output CSV file path. If not provided, prints a preview to stdout."
+        help="Output file path. If not provided, prints a preview to stdout."
+    )
+
+    parser.add_argument(
+        "--format",
+        choices=["csv", "parquet"],
+        default=None,
+        help="Output file format. Defaults to parquet for '.parquet' paths, csv otherwise."
     )
 
     parser.add_argument(
@@ -38,6 +46,13 @@ def build_parser() -> argparse.ArgumentParser:
         help="Optional limit on number of records (for safety/testing)."
     )
 
+    parser.add_argument(
+        "--no-cache",
+        dest="cache",
+        action="store_false",
+        help="Always query the remote database instead of the local response cache."
+    )
+
     return parser
 
 
@@ -45,18 +60,28 @@ def main(argv: list[str] | None = None) -> int:
     parser = build_parser()
     args = parser.parse_args(argv)
 
+    out_format = args.format
+    if args.out and out_format is None:
+        out_format = "parquet" if args.out.lower().endswith(".parquet") else "csv"
+    # fail before any download rather than after it
+    if args.out and out_format == "parquet" and not HAVE_PYARROW:
+        parser.error("--format parquet requires pyarrow")
+
     if args.source == "geo":
-        df = fetch_geo_series(args.id, limit=args.limit)
+        df = fetch_geo_series(args.id, limit=args.limit, cache=args.cache)
     elif args.source == "sra":
-        df = fetch_sra_bioproject(args.id, limit=args.limit)
+        df = fetch_sra_bioproject(args.id, limit=args.limit, cache=args.cache)
     elif args.source == "ena":
-        df = fetch_ena_accession(args.id, limit=args.limit)
+        df = fetch_ena_accession(args.id, limit=args.limit, cache=args.cache)
     else:
         parser.error("Unknown source")
         return 1
 
     if args.out:
-        df.to_csv(args.out, index=False)
+        if out_format == "parquet":
+            df.to_parquet(args.out, compression="zstd", index=False)
+        else:
+            df.to_csv(args.out, index=False)
         print(f"Saved {len(df)} records to {args.out}")
     else:
         # فقط چند رکورد برای preview
@@ -1,10 +1,22 @@
 from __future__ import annotations
 
-import io
 from typing import Optional
 
 import pandas as pd
-import requests
+
+from biodownloader._backend import (
+    HAVE_PYARROW,
+    PANDAS_NA_VALUES,
+    normalize_frame,
+    resolve_backend,
+)
+from biodownloader._cache import cache_key, load_frame, store_frame
+from biodownloader._http import SESSION, open_body
+
+try:  # optional fast CSV/TSV parser
+    import polars as pl
+except ImportError:  # pragma: no cover - polars is an optional extra
+    pl = None
 
 # ENA Browser API base URL
 ENA_BASE_URL = "https://www.ebi.ac.uk/ena/portal/api/search"
@@ -15,6 +27,8 @@ def _ena_query(
     result: str = "read_run",
     limit: Optional[int] = None,
     timeout: int = 30,
+    cache: bool = True,
+    backend: str = "numpy",
 ) -> pd.DataFrame:
     """
     Internal helper to query ENA and return a DataFrame.
@@ -26,15 +40,38 @@ def _ena_query(
         "limit": 0,  # 0 => no server-side limit
     }
 
-    resp = requests.get(ENA_BASE_URL, params=params, timeout=timeout)
-    resp.raise_for_status()
-
-    text = resp.text
-    if not text.strip():
-        return pd.DataFrame()
-
-    # ENA returns a TSV header even if there are 0 rows; pandas can read it.
-    df = pd.read_csv(io.StringIO(text), sep="\t")
+    key = cache_key(ENA_BASE_URL, {**params, "backend": backend})
+    df = load_frame(key) if cache else None
+    if df is not None:
+        df = normalize_frame(df, backend)
+        return df.head(limit) if limit is not None else df
+
+    # stream the body into the parser instead of buffering resp.text
+    with SESSION.get(ENA_BASE_URL, params=params, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+
+        with open_body(resp) as body:
+            # ENA returns a TSV header even if there are 0 rows; both parsers can read it.
+            if body is None:
+                df = pd.DataFrame()
+            elif pl is not None and HAVE_PYARROW:  # DataFrame.to_pandas() needs pyarrow
+                df = pl.read_csv(
+                    body,
+                    separator="\t",
+                    infer_schema_length=None,
+                    null_values=PANDAS_NA_VALUES,
+                ).to_pandas(
+                    use_pyarrow_extension_array=backend == "pyarrow"
+                )
+            elif backend == "pyarrow":
+                df = pd.read_csv(body, sep="\t", engine="pyarrow", dtype_backend="pyarrow")
+            else:
+                df = pd.read_csv(body, sep="\t")
+
+    df = normalize_frame(df, backend)
+
+    if cache:
+        store_frame(key, df)
 
     if limit is not None:
         df = df.head(limit)
@@ -46,6 +83,8 @@ def fetch_ena_accession(
     accession: str,
     limit: Optional[int] = None,
     timeout: int = 30,
+    cache: bool = True,
+    backend: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Fetch ENA metadata for a given accession (run, study, etc.) using the ENA portal API.
@@ -62,6 +101,14 @@ def fetch_ena_accession(
         If provided, only the first `limit` rows are returned.
     timeout : int
         HTTP timeout in seconds.
+    cache : bool
+        If True (default), reuse a recent on-disk copy of the result and
+        store fresh results there. Pass False to always query ENA.
+    backend : {"pyarrow", "numpy"}, optional
+        Column storage of the returned table. "pyarrow" gives Arrow-backed
+        columns, which are far smaller for repeated text values; "numpy"
+        keeps classic object columns. Defaults to "pyarrow" when pyarrow
+        is installed.
 
     Returns
     -------
@@ -79,12 +126,14 @@ def fetch_ena_accession(
     accession = accession.strip()
     if not accession:
         raise ValueError("accession cannot be empty (e.g., 'SRR23080510' or 'PRJEB12345').")
+    backend = resolve_backend(backend)
 
-    # First try a generic accession query
-    df = _ena_query(f"accession={accession}", result="read_run", limit=limit, timeout=timeout)
-
-    # If nothing found, and it looks like a run accession, try run_accession=...
-    if df.empty and accession.upper().startswith(("SRR", "ERR", "DRR")):
-        df = _ena_query(f"run_accession={accession}", result="read_run", limit=limit, timeout=timeout)
+    # Run accessions are only found via run_accession=..., so query that directly
+    # instead of spending a round-trip on the generic query first
+    if accession.upper().startswith(("SRR", "ERR", "DRR")):
+        df = _ena_query(f"run_accession={accession}", result="read_run", limit=limit, timeout=timeout, cache=cache, backend=backend)
+        if not df.empty:
+            return df
 
-    return df
+    # Generic accession query (studies, samples, ... or a run the above missed)
+    return _ena_query(f"accession={accession}", result="read_run", limit=limit, timeout=timeout, cache=cache, backend=backend)
@@ -6,25 +6,56 @@ from typing import List, Dict, Optional
 import pandas as pd
 import requests
 
+from biodownloader._backend import normalize_frame, resolve_backend
+from biodownloader._cache import cache_key, load_frame, store_frame
+from biodownloader._http import SESSION
+
 
 GEO_BASE_URL = (
     "https://www.ncbi.nlm.nih.gov/geo/query/acc.cgi?"
     "targ=all&form=text&view=quick&acc="
 )
 
+# matches either the start of a sample block or one of the !Sample_* fields we keep;
+# runs on the raw bytes, and fields are ordered by how often they occur in real series
+SOFT_SAMPLE_RE = re.compile(
+    rb"^\^SAMPLE\s=\s(GSM\d+)"
+    rb"|^!Sample_(characteristics_ch1|title|organism_ch1|source_name_ch1) =(.*)$",
+    re.M,
+)
+
+# every sample block starts with this line prefix
+SOFT_SAMPLE_MARKER = b"\n^SAMPLE"
+
+# SOFT field name -> output column
+SOFT_SAMPLE_FIELDS = {
+    b"characteristics_ch1": "characteristics",
+    b"title": "title",
+    b"organism_ch1": "organism",
+    b"source_name_ch1": "source_name",
+}
+
 
-def _parse_geo_soft_quick(raw_text: str, gse_id: str, limit: Optional[int] = None) -> pd.DataFrame:
+def _parse_geo_soft_quick(
+    raw: bytes,
+    gse_id: str,
+    limit: Optional[int] = None,
+    encoding: str = "utf-8",
+) -> pd.DataFrame:
     """
     Parse the GEO 'quick' SOFT text into a tidy sample-level DataFrame.
 
     Parameters
     ----------
-    raw_text : str
-        The full SOFT/quick text returned by GEO.
+    raw : bytes
+        The SOFT/quick body returned by GEO, undecoded. Only the kept
+        field values are decoded, never the whole document.
     gse_id : str
         The GSE accession (for adding as a column).
     limit : int, optional
         Optional maximum number of samples to parse.
+    encoding : str, optional
+        Text encoding of `raw`, used to decode field values.
 
     Returns
     -------
@@ -32,27 +63,33 @@ def _parse_geo_soft_quick(raw_text: str, gse_id: str, limit: Optional[int] = Non
         Rows: GSM samples
         Columns: GSE, GSM, title, organism, source_name, characteristics
     """
-    samples: List[Dict[str, str]] = []
-
+    # one list per output column (columnar build, no per-sample dicts)
+    gsms: List[str] = []
+    titles: List[str] = []
+    organisms: List[str] = []
+    sources: List[str] = []
+    chars: List[str] = []
+
+    # values collected for the sample currently being read
     current: Dict[str, List[str]] | None = None
-    current_gsm: Optional[str] = None
-
-    # regex to detect the start of a new sample block
-    sample_start_re = re.compile(r"^\^SAMPLE\s=\s(GSM\d+)")
 
-    # iterate line by line over the SOFT text
-    for line in raw_text.splitlines():
-        line = line.rstrip("\n")
+    # one pass of the regex engine over the whole text, no per-line Python work
+    for m in SOFT_SAMPLE_RE.finditer(raw):
+        gsm = m.group(1)
 
         # start of a new sample
-        m = sample_start_re.match(line)
-        if m:
+        if gsm is not None:
             # if we had a previous sample, finalize and store it
-            if current is not None and current_gsm is not None:
-                samples.append(_finalize_sample_dict(current, current_gsm, gse_id))
+            if current is not None:
+                titles.append(_join_or_empty(current["title"]))
+                organisms.append(_join_or_empty(current["organism"]))
+                sources.append(_join_or_empty(current["source_name"]))
+                chars.append(_join_or_empty(current["characteristics"]))
+                current = None
 
-                if limit is not None and len(samples) >= limit:
-                    break
+            # stop at the first sample past the limit; the rest of the text is never scanned
+            if limit is not None and len(gsms) >= limit:
+                break
 
             # initialize container for a new sample
             current = {
@@ -61,7 +98,7 @@ def _parse_geo_soft_quick(raw_text: str, gse_id: str, limit: Optional[int] = Non
                 "source_name": [],
                 "characteristics": [],
             }
-            current_gsm = m.group(1)
+            gsms.append(gsm.decode("ascii"))
             continue
 
         if current is None:
@@ -69,54 +106,79 @@ def _parse_geo_soft_quick(raw_text: str, gse_id: str, limit: Optional[int] = Non
             continue
 
         # handle the !Sample_* lines
-        if line.startswith("!Sample_title ="):
-            value = line.split("=", 1)[1].strip()
-            current["title"].append(value)
-        elif line.startswith("!Sample_organism_ch1 ="):
-            value = line.split("=", 1)[1].strip()
-            current["organism"].append(value)
-        elif line.startswith("!Sample_source_name_ch1 ="):
-            value = line.split("=", 1)[1].strip()
-            current["source_name"].append(value)
-        elif line.startswith("!Sample_characteristics_ch1 ="):
-            value = line.split("=", 1)[1].strip()
-            current["characteristics"].append(value)
+        current[SOFT_SAMPLE_FIELDS[m.group(2)]].append(
+            m.group(3).decode(encoding, errors="replace").strip()
+        )
 
     # finalize and append the last sample if present
-    if current is not None and current_gsm is not None:
-        samples.append(_finalize_sample_dict(current, current_gsm, gse_id))
+    if current is not None:
+        titles.append(_join_or_empty(current["title"]))
+        organisms.append(_join_or_empty(current["organism"]))
+        sources.append(_join_or_empty(current["source_name"]))
+        chars.append(_join_or_empty(current["characteristics"]))
 
-    if not samples:
+    if not gsms:
         return pd.DataFrame(
             columns=["GSE", "GSM", "title", "organism", "source_name", "characteristics"]
         )
 
-    return pd.DataFrame(samples)
-
-
-def _finalize_sample_dict(
-    raw_dict: Dict[str, List[str]],
-    gsm: str,
-    gse_id: str
-) -> Dict[str, str]:
-    """Helper: convert lists to strings and attach GSM/GSE identifiers."""
-    def join_or_empty(values: List[str]) -> str:
-        if not values:
-            return ""
-        # if there are multiple values, join them with ";"
-        return "; ".join(values)
-
-    return {
-        "GSE": gse_id,
-        "GSM": gsm,
-        "title": join_or_empty(raw_dict.get("title", [])),
-        "organism": join_or_empty(raw_dict.get("organism", [])),
-        "source_name": join_or_empty(raw_dict.get("source_name", [])),
-        "characteristics": join_or_empty(raw_dict.get("characteristics", [])),
-    }
-
+    return pd.DataFrame(
+        {
+            "GSE": [gse_id] * len(gsms),
+            "GSM": gsms,
+            "title": titles,
+            "organism": organisms,
+            "source_name": sources,
+            "characteristics": chars,
+        },
+        copy=False,
+    )
+
+
+def _join_or_empty(values: List[str]) -> str:
+    """Helper: collapse the values of one field into a single string."""
+    n = len(values)
+    if n == 0:
+        return ""
+    # most fields hold a single value; hand it back without building a new string
+    if n == 1:
+        return values[0]
+    # if there are multiple values, join them with ";"
+    return "; ".join(values)
+
+
+def _read_soft_bytes(resp: requests.Response, limit: Optional[int] = None) -> bytes:
+    """
+    Helper: read a streamed SOFT response body, stopping after `limit` samples.
 
-def fetch_geo_series(gse_id: str, limit: int | None = None, timeout: int = 30) -> pd.DataFrame:
+    The body is only downloaded until the (limit + 1)-th ^SAMPLE marker,
+    which is enough for the parser to finalize the first `limit` samples.
+    """
+    if limit is None:
+        return resp.content
+
+    chunks: List[bytes] = []
+    seen = 0
+    tail = b""
+    for chunk in resp.iter_content(chunk_size=1 << 16):
+        chunks.append(chunk)
+        # carry a few bytes over so markers split across chunks are still counted
+        window = tail + chunk
+        seen += window.count(SOFT_SAMPLE_MARKER)
+        tail = window[-(len(SOFT_SAMPLE_MARKER) - 1):]
+        if seen > limit:
+            break
+
+    return b"".join(chunks)
+
+
+def fetch_geo_series(
+    gse_id: str,
+    limit: int | None = None,
+    timeout: int = 30,
+    cache: bool = True,
+    backend: Optional[str] = None,
+) -> pd.DataFrame:
     """
     Fetch metadata for a GEO series (GSE*) and return a tidy sample-level table.
 
@@ -128,6 +190,14 @@ def fetch_geo_series(gse_id: str, limit: int | None = None, timeout: int = 30) -
         Optional maximum number of samples to parse (useful for testing).
     timeout : int, optional
         HTTP timeout in seconds.
+    cache : bool, optional
+        If True (default), reuse a recent on-disk copy of the parsed table
+        and store fresh results there. Pass False to always query GEO.
+    backend : {"pyarrow", "numpy"}, optional
+        Column storage of the returned table. "pyarrow" stores text as Arrow
+        strings and `organism` / `source_name` as categoricals; "numpy"
+        keeps classic object columns. Defaults to "pyarrow" when pyarrow
+        is installed.
 
     Returns
     -------
@@ -151,19 +221,43 @@ def fetch_geo_series(gse_id: str, limit: int | None = None, timeout: int = 30) -
 
     if not gse_id.upper().startswith("GSE"):
         raise ValueError(f"Expected a GEO Series accession starting with 'GSE', got: {gse_id!r}")
+    backend = resolve_backend(backend)
 
     url = GEO_BASE_URL + gse_id
-    resp = requests.get(url, timeout=timeout)
-    resp.raise_for_status()
 
-    text = resp.text
+    # the parser stops early when a limit is given, so it is part of the key
+    key = cache_key(url, {"limit": limit, "backend": backend})
+    df = load_frame(key) if cache else None
+    if df is not None:
+        return normalize_frame(df, backend)
+
+    with SESSION.get(url, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+        raw = _read_soft_bytes(resp, limit=limit)
+        encoding = resp.encoding or "utf-8"
 
-    # if GEO returns nothing useful or a weird response, fall back to an empty DataFrame
-    if "Series" not in text and "^SAMPLE" not in text:
+    # if GEO returns nothing useful or a weird response, fall back to an empty DataFrame;
+    # checked on the raw bytes; the parser below also works on bytes
+    if b"Series" not in raw and b"^SAMPLE" not in raw:
         # be conservative and return an empty DataFrame with the expected columns
-        return pd.DataFrame(
+        df = pd.DataFrame(
             columns=["GSE", "GSM", "title", "organism", "source_name", "characteristics"]
         )
+    else:
+        df = _parse_geo_soft_quick(raw, gse_id=gse_id, limit=limit, encoding=encoding)
+
+    if backend == "pyarrow":
+        # every GEO column is text; a handful of organisms / tissues repeat across all samples
+        df = df.astype(
+            {
+                col: "category" if col in ("organism", "source_name") else "string"
+                for col in df.columns
+            }
+        )
+        df = normalize_frame(df, backend)
+
+    if cache:
+        store_frame(key, df)
 
-    return _parse_geo_soft_quick(text, gse_id=gse_id, limit=limit)
+    return df
 
@@ -1,9 +1,11 @@
 from __future__ import annotations
 
 import re
+from concurrent.futures import ThreadPoolExecutor
 from typing import Optional
 
 import pandas as pd
+from pandas.api.types import is_numeric_dtype, is_string_dtype
 
 from biodownloader.geo import fetch_geo_series
 from biodownloader.sra import fetch_sra_bioproject
@@ -11,6 +13,62 @@ from biodownloader.sra import fetch_sra_bioproject
 
 GSM_PATTERN = re.compile(r"GSM\d+")
 
+# join-key placeholders for missing values, distinct per side so they never match
+_MISSING_GEO_KEY = "\0missing-geo"
+_MISSING_SRA_KEY = "\0missing-sra"
+
+# rows checked before falling back to a full-column scan
+GSM_HEAD_ROWS = 32
+
+
+def _as_text(series: pd.Series) -> pd.Series:
+    """Helper: view a column as strings, converting only non-text dtypes."""
+    # is_string_dtype is True for str / StringDtype / Arrow string columns, and for
+    # object columns pandas infers as text (whether str mixed with NaN counts as text
+    # depends on the pandas version); every other dtype goes through astype(str)
+    if is_string_dtype(series):
+        return series
+    return series.astype(str)
+
+
+def _has_gsm(series: pd.Series, full_match: bool = False) -> bool:
+    """Helper: True if any value contains (or, with full_match, is) a GSM ID."""
+    text = _as_text(series).str
+    if full_match:
+        return bool(text.fullmatch(GSM_PATTERN.pattern, na=False).any())
+    return bool(text.contains(GSM_PATTERN.pattern, regex=True, na=False).any())
+
+
+def _find_gsm_column(df: pd.DataFrame, columns, full_match: bool = False) -> Optional[str]:
+    """
+    Return the first of `columns` holding GSM IDs.
+
+    GSM-bearing columns almost always show an ID in their first rows, so all
+    heads are checked before any column is scanned in full.
+    """
+    for col in columns:
+        if _has_gsm(df[col].head(GSM_HEAD_ROWS), full_match=full_match):
+            return col
+
+    if len(df) > GSM_HEAD_ROWS:
+        for col in columns:
+            if _has_gsm(df[col], full_match=full_match):
+                return col
+
+    return None
+
+
+def _gsm_key(series: pd.Series) -> pd.Series:
+    """Helper: the GSM ID inside each value, or the value itself if it has none."""
+    if is_numeric_dtype(series):
+        # numbers hold no GSM ID; keep them numeric so 1 still matches 1.0
+        return series
+    text = _as_text(series)
+    # named group: Arrow-backed string columns refuse unnamed groups in extract
+    key = text.str.extract(f"(?P<gsm>{GSM_PATTERN.pattern})", expand=False).fillna(text)
+    # astype(str) may have turned missing values into "nan"; keep them missing
+    return key.where(series.notna())
+
 
 def _detect_geo_gsm_column(df: pd.DataFrame) -> Optional[str]:
     """
@@ -18,19 +76,18 @@ def _detect_geo_gsm_column(df: pd.DataFrame) -> Optional[str]:
     """
     # First: explicit candidates
     candidate_names = ["GSM", "Sample", "Sample_ID", "GEO_accession"]
-    for col in df.columns:
-        if col in candidate_names or col.upper() in ("GSM", "SAMPLE", "GEO_ACCESSION"):
-            series = df[col].astype(str)
-            if series.str.contains(GSM_PATTERN).any():
-                return col
-
-    # Fallback: scan all object columns for GSM-like patterns
-    for col in df.select_dtypes(include="object").columns:
-        series = df[col].astype(str)
-        if series.str.fullmatch(GSM_PATTERN).any():
-            return col
-
-    return None
+    candidates = [
+        col for col in df.columns
+        if col in candidate_names or col.upper() in ("GSM", "SAMPLE", "GEO_ACCESSION")
+    ]
+    col = _find_gsm_column(df, candidates)
+    if col is not None:
+        return col
+
+    # Fallback: scan all text columns for GSM-like patterns
+    return _find_gsm_column(
+        df, df.select_dtypes(include=["object", "string"]).columns, full_match=True
+    )
 
 
 def _detect_sra_gsm_column(df: pd.DataFrame) -> Optional[str]:
@@ -39,19 +96,16 @@ def _detect_sra_gsm_column(df: pd.DataFrame) -> Optional[str]:
     Often this is 'SampleName' or a similar text field.
     """
     candidate_names = ["SampleName", "sample_name", "GEO_Accession", "geo_accession"]
-    for col in df.columns:
-        if col in candidate_names or col.lower() in ("samplename", "sample_name", "geo_accession"):
-            series = df[col].astype(str)
-            if series.str.contains(GSM_PATTERN).any():
-                return col
+    candidates = [
+        col for col in df.columns
+        if col in candidate_names or col.lower() in ("samplename", "sample_name", "geo_accession")
+    ]
+    col = _find_gsm_column(df, candidates)
+    if col is not None:
+        return col
 
-    # Fallback: scan all object columns for a GSM substring
-    for col in df.select_dtypes(include="object").columns:
-        series = df[col].astype(str)
-        if series.str.contains(GSM_PATTERN).any():
-            return col
-
-    return None
+    # Fallback: scan all text columns for a GSM substring
+    return _find_gsm_column(df, df.select_dtypes(include=["object", "string"]).columns)
 
 
 def merge_geo_sra(
@@ -79,6 +133,12 @@ def merge_geo_sra(
         Column name in SRA table that contains GSM IDs (or GSM-like text).
         If None, an automatic detection is attempted.
 
+    Rows are matched on the GSM ID extracted from each key column, so values
+    such as "GSM1234567: patient_42" join with "GSM1234567". Values without a
+    GSM ID are compared as-is, and missing values never match. When both key
+    columns share a name, a single key column is returned (holding the GEO
+    value, or the SRA value for SRA-only rows), as with a plain merge.
+
     Returns
     -------
     pandas.DataFrame
@@ -100,13 +160,34 @@ def merge_geo_sra(
             "Please provide 'geo_gsm_col' and 'sra_gsm_col' explicitly."
         )
 
-    merged = geo_df.merge(
-        sra_df,
-        left_on=geo_gsm_col,
-        right_on=sra_gsm_col,
+    # join on the GSM substring so noisy cells like "GSM1234567: patient_42" still match
+    left_key = _gsm_key(geo_df[geo_gsm_col])
+    right_key = _gsm_key(sra_df[sra_gsm_col])
+
+    # pandas joins missing keys to each other; give each side its own placeholder
+    left_key = left_key.fillna(_MISSING_GEO_KEY)
+    right_key = right_key.fillna(_MISSING_SRA_KEY)
+
+    # one shared categorical dtype lets pandas hash-join on integer codes with no coercion
+    all_keys = pd.concat([left_key, right_key], ignore_index=True)
+    key_dtype = pd.CategoricalDtype(all_keys.unique())
+    left = geo_df.assign(_gsm_key=left_key.astype(key_dtype))
+    right = sra_df.assign(_gsm_key=right_key.astype(key_dtype))
+
+    merged = left.merge(
+        right,
+        on="_gsm_key",
         how=how,
         suffixes=("_geo", "_sra"),
     )
+    merged = merged.drop(columns="_gsm_key")
+
+    if geo_gsm_col == sra_gsm_col:
+        # a plain merge on one shared column name returns that column once; keep that shape
+        geo_name, sra_name = f"{geo_gsm_col}_geo", f"{sra_gsm_col}_sra"
+        merged[geo_name] = merged[geo_name].fillna(merged[sra_name])
+        merged = merged.drop(columns=sra_name).rename(columns={geo_name: geo_gsm_col})
+
     return merged
 
 
@@ -116,6 +197,8 @@ def fetch_and_merge_geo_sra(
     geo_limit: Optional[int] = None,
     sra_limit: Optional[int] = None,
     how: str = "inner",
+    cache: bool = True,
+    backend: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Convenience wrapper: fetch GEO + SRA metadata and merge them.
@@ -133,14 +216,22 @@ def fetch_and_merge_geo_sra(
         Maximum number of SRA runs to fetch (None = no limit).
     how : str
         Merge mode ('inner', 'left', etc.).
+    cache : bool
+        Passed on to both fetchers; False bypasses the on-disk cache.
+    backend : {"pyarrow", "numpy"}, optional
+        Column storage passed on to both fetchers.
 
     Returns
     -------
     pandas.DataFrame
         Merged GEO–SRA metadata table.
     """
-    geo_df = fetch_geo_series(gse_id, limit=geo_limit)
-    sra_df = fetch_sra_bioproject(sra_term, limit=sra_limit)
+    # GEO and SRA live on different servers, so overlap the two network fetches
+    with ThreadPoolExecutor(max_workers=2) as executor:
+        geo_future = executor.submit(fetch_geo_series, gse_id, limit=geo_limit, cache=cache, backend=backend)
+        sra_future = executor.submit(fetch_sra_bioproject, sra_term, limit=sra_limit, cache=cache, backend=backend)
+        geo_df = geo_future.result()
+        sra_df = sra_future.result()
 
     if geo_df.empty or sra_df.empty:
         # Return an empty merge with the expected shape,
@@ -1,11 +1,27 @@
 from __future__ import annotations
 
-import io
 from typing import Optional, Tuple
 
 import pandas as pd
-import requests
-import xml.etree.ElementTree as ET
+
+from biodownloader._backend import (
+    HAVE_PYARROW,
+    PANDAS_NA_VALUES,
+    normalize_frame,
+    resolve_backend,
+)
+from biodownloader._cache import cache_key, load_frame, store_frame
+from biodownloader._http import SESSION, open_body
+
+try:  # optional fast CSV/TSV parser
+    import polars as pl
+except ImportError:  # pragma: no cover - polars is an optional extra
+    pl = None
+
+try:  # optional C XML parser, same API subset as ElementTree
+    from lxml import etree as ET
+except ImportError:  # pragma: no cover - lxml is an optional extra
+    import xml.etree.ElementTree as ET
 
 
 # NCBI E-utilities base endpoint
@@ -39,14 +55,16 @@ def _esearch_sra(
         "retmode": "xml",
     }
 
-    resp = requests.get(EUTILS_BASE + "esearch.fcgi", params=params, timeout=timeout)
+    resp = SESSION.get(EUTILS_BASE + "esearch.fcgi", params=params, timeout=timeout)
     resp.raise_for_status()
 
-    root = ET.fromstring(resp.text)
+    # parse the raw bytes; both parsers handle the XML declaration themselves
+    root = ET.fromstring(resp.content)
 
-    webenv = root.findtext(".//WebEnv")
-    query_key = root.findtext(".//QueryKey")
-    count_text = root.findtext(".//Count") or "0"
+    # these are direct children of <eSearchResult>, no subtree scan needed
+    webenv = root.findtext("WebEnv")
+    query_key = root.findtext("QueryKey")
+    count_text = root.findtext("Count") or "0"
 
     try:
         count = int(count_text)
@@ -63,6 +81,8 @@ def fetch_sra_bioproject(
     accession: str,
     limit: Optional[int] = None,
     timeout: int = 30,
+    cache: bool = True,
+    backend: Optional[str] = None,
 ) -> pd.DataFrame:
     """
     Fetch SRA RunInfo metadata using NCBI E-utilities (esearch → efetch).
@@ -78,6 +98,14 @@ def fetch_sra_bioproject(
         If provided, only the first N rows of RunInfo are returned.
     timeout : int
         HTTP timeout in seconds.
+    cache : bool
+        If True (default), reuse a recent on-disk copy of the RunInfo table
+        and store fresh results there. Pass False to always query NCBI.
+    backend : {"pyarrow", "numpy"}, optional
+        Column storage of the returned table. "pyarrow" gives Arrow-backed
+        columns, which are far smaller for repeated text values; "numpy"
+        keeps classic object columns. Defaults to "pyarrow" when pyarrow
+        is installed.
 
     Returns
     -------
@@ -98,6 +126,14 @@ def fetch_sra_bioproject(
     accession = accession.strip()
     if not accession:
         raise ValueError("accession cannot be empty (e.g., 'PRJNA730495').")
+    backend = resolve_backend(backend)
+
+    # WebEnv/QueryKey change on every esearch, so key the cache on the search term
+    key = cache_key(EUTILS_BASE + "efetch.fcgi", {"term": accession, "rettype": "runinfo", "backend": backend})
+    df = load_frame(key) if cache else None
+    if df is not None:
+        df = normalize_frame(df, backend)
+        return df.head(limit) if limit is not None else df
 
     # Step 1 — esearch: get WebEnv and QueryKey
     webenv, query_key, count = _esearch_sra(accession, timeout=timeout)
@@ -113,14 +149,31 @@ def fetch_sra_bioproject(
         "rettype": "runinfo",
     }
 
-    resp = requests.get(EUTILS_BASE + "efetch.fcgi", params=params, timeout=timeout)
-    resp.raise_for_status()
-
-    text = resp.text
-    if not text.strip():
-        return pd.DataFrame()
-
-    df = pd.read_csv(io.StringIO(text))
+    # stream the body into the parser instead of buffering resp.text
+    with SESSION.get(EUTILS_BASE + "efetch.fcgi", params=params, timeout=timeout, stream=True) as resp:
+        resp.raise_for_status()
+
+        with open_body(resp) as body:
+            if body is None:
+                df = pd.DataFrame()
+            elif pl is not None and HAVE_PYARROW:  # DataFrame.to_pandas() needs pyarrow
+                df = pl.read_csv(
+                    body,
+                    separator=",",
+                    infer_schema_length=None,
+                    null_values=PANDAS_NA_VALUES,
+                ).to_pandas(
+                    use_pyarrow_extension_array=backend == "pyarrow"
+                )
+            elif backend == "pyarrow":
+                df = pd.read_csv(body, engine="pyarrow", dtype_backend="pyarrow")
+            else:
+                df = pd.read_csv(body)
+
+    df = normalize_frame(df, backend)
+
+    if cache:
+        store_frame(key, df)
 
     if limit is not None:
         df = df.head(limit)
@@ -0,0 +1,58 @@
+from __future__ import annotations
+
+import io
+from typing import Dict, List, Optional
+
+import pytest
+import requests
+import urllib3
+
+import biodownloader._cache as _cache
+
+
+def make_response(
+    body: bytes,
+    headers: Optional[Dict[str, str]] = None,
+    status: int = 200,
+) -> requests.Response:
+    """Build a streamed requests.Response around an in-memory body."""
+    resp = requests.Response()
+    resp.status_code = status
+    resp.headers.update(headers or {})
+    resp.raw = urllib3.HTTPResponse(
+        body=io.BytesIO(body),
+        headers=headers,
+        status=status,
+        preload_content=False,
+    )
+    resp.encoding = "utf-8"
+    return resp
+
+
+class FakeSession:
+    """Stands in for _http.SESSION and replays canned responses in order."""
+
+    def __init__(self, responses: List[requests.Response]):
+        self.responses = list(responses)
+        self.calls: List[dict] = []
+
+    def get(self, url, **kwargs):
+        self.calls.append({"url": url, **kwargs})
+        return self.responses.pop(0)
+
+
+@pytest.fixture(autouse=True)
+def isolated_cache(tmp_path, monkeypatch):
+    """Keep every test away from the user's real cache directory."""
+    monkeypatch.setattr(_cache, "CACHE_DIR", tmp_path / "cache")
+    return tmp_path / "cache"
+
+
+@pytest.fixture
+def fake_session(monkeypatch):
+    """Patch SESSION in the given fetcher module with canned responses."""
+    def install(module, *bodies, headers=None):
+        session = FakeSession([make_response(b, headers=headers) for b in bodies])
+        monkeypatch.setattr(module, "SESSION", session)
+        return session
+    return install
@@ -0,0 +1,87 @@
+import pandas as pd
+import pytest
+
+import biodownloader.ena as ena
+import biodownloader.geo as geo
+
+pa = pytest.importorskip("pyarrow")
+
+ENA_TSV = b"run_accession\tread_count\tdescription\nERR1\t10\tfoo\nERR2\t20\t\n"
+
+GEO_SOFT = (
+    b"^SERIES = GSE1\n"
+    b"^SAMPLE = GSM1\n!Sample_title = a\n!Sample_organism_ch1 = Homo sapiens\n"
+    b"^SAMPLE = GSM2\n!Sample_title = b\n!Sample_organism_ch1 = Homo sapiens\n"
+)
+
+
+@pytest.mark.parametrize("use_polars", [True, False])
+def test_ena_pyarrow_dtypes_are_stable_across_parsers_and_cache(fake_session, monkeypatch, use_polars):
+    if not use_polars:
+        monkeypatch.setattr(ena, "pl", None)
+    elif ena.pl is None:
+        pytest.skip("polars not installed")
+    session = fake_session(ena, ENA_TSV)
+
+    fresh = ena.fetch_ena_accession("PRJEB1", backend="pyarrow")
+    cached = ena.fetch_ena_accession("PRJEB1", backend="pyarrow")
+
+    assert len(session.calls) == 1
+    assert list(fresh.dtypes) == [
+        pd.ArrowDtype(pa.string()),
+        pd.ArrowDtype(pa.int64()),
+        pd.ArrowDtype(pa.string()),
+    ]
+    assert list(cached.dtypes) == list(fresh.dtypes)
+    assert cached.equals(fresh)
+
+
+def test_ena_numpy_backend_keeps_numpy_columns(fake_session):
+    fake_session(ena, ENA_TSV)
+
+    df = ena.fetch_ena_accession("PRJEB1", backend="numpy")
+
+    assert df["read_count"].dtype == "int64"
+    assert all(not isinstance(dtype, pd.ArrowDtype) for dtype in df.dtypes)
+
+
+def test_geo_pyarrow_dtypes_are_stable_across_cache(fake_session):
+    session = fake_session(geo, GEO_SOFT)
+
+    fresh = geo.fetch_geo_series("GSE1", backend="pyarrow")
+    cached = geo.fetch_geo_series("GSE1", backend="pyarrow")
+
+    assert len(session.calls) == 1
+    assert fresh["GSM"].dtype == pd.ArrowDtype(pa.string())
+    assert isinstance(fresh["organism"].dtype, pd.CategoricalDtype)
+    assert isinstance(fresh["source_name"].dtype, pd.CategoricalDtype)
+    assert dict(cached.dtypes) == dict(fresh.dtypes)
+    assert cached.equals(fresh)
+
+
+def test_geo_empty_table_dtypes(fake_session):
+    fake_session(geo, b"nothing here", b"nothing here")
+
+    arrow = geo.fetch_geo_series("GSE000000", backend="pyarrow")
+    numpy = geo.fetch_geo_series("GSE000000", backend="numpy")
+
+    assert arrow.empty and numpy.empty
+    assert list(arrow.columns) == list(numpy.columns)
+    assert arrow["GSM"].dtype == pd.ArrowDtype(pa.string())
+    assert isinstance(arrow["organism"].dtype, pd.CategoricalDtype)
+    assert numpy["GSM"].dtype == object
+
+
+def test_merge_accepts_pyarrow_tables(fake_session):
+    from biodownloader.integrate import merge_geo_sra
+
+    fake_session(geo, GEO_SOFT)
+    geo_df = geo.fetch_geo_series("GSE1", backend="pyarrow")
+    sra_df = pd.DataFrame(
+        {"Run": ["SRR1"], "SampleName": ["GSM2: patient_1"]}
+    ).convert_dtypes(dtype_backend="pyarrow")
+
+    merged = merge_geo_sra(geo_df, sra_df)
+
+    assert merged["GSM"].tolist() == ["GSM2"]
+    assert merged["Run"].tolist() == ["SRR1"]
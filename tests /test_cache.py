@@ -0,0 +1,59 @@
+import os
+import time
+
+import pandas as pd
+import pytest
+
+import biodownloader._cache as _cache
+import biodownloader.ena as ena
+
+pytest.importorskip("pyarrow")
+
+
+def test_cache_key_is_stable_and_order_independent():
+    a = _cache.cache_key("https://x/api", {"query": "acc=1", "format": "tsv"})
+    b = _cache.cache_key("https://x/api", {"format": "tsv", "query": "acc=1"})
+
+    assert a == b
+    assert a != _cache.cache_key("https://x/api", {"query": "acc=2", "format": "tsv"})
+    assert a != _cache.cache_key("https://y/api", {"query": "acc=1", "format": "tsv"})
+
+
+def test_round_trip_and_expiry(isolated_cache):
+    key = _cache.cache_key("https://x/api", {"query": "acc=1"})
+    df = pd.DataFrame({"Run": ["SRR1", "SRR2"], "spots": [1, 2]})
+
+    _cache.store_frame(key, df)
+    assert _cache.load_frame(key).equals(df)
+
+    # age the entry past the expiry window
+    path = isolated_cache / f"{key}.parquet"
+    old = time.time() - _cache.CACHE_EXPIRE_AFTER - 10
+    os.utime(path, (old, old))
+    assert _cache.load_frame(key) is None
+
+
+def test_corrupt_entry_counts_as_miss(isolated_cache):
+    key = _cache.cache_key("https://x/api", {"query": "acc=1"})
+    isolated_cache.mkdir(parents=True)
+    (isolated_cache / f"{key}.parquet").write_bytes(b"not a parquet file")
+
+    assert _cache.load_frame(key) is None
+
+
+def test_empty_results_are_not_stored(isolated_cache):
+    key = _cache.cache_key("https://x/api", {"query": "acc=1"})
+    _cache.store_frame(key, pd.DataFrame(columns=["Run"]))
+
+    assert _cache.load_frame(key) is None
+    assert not isolated_cache.exists() or not any(isolated_cache.iterdir())
+
+
+def test_fetcher_reuses_cached_table(fake_session):
+    session = fake_session(ena, b"run_accession\tdescription\nERR1\tfoo\n")
+
+    first = ena.fetch_ena_accession("ERR1", backend="numpy")
+    second = ena.fetch_ena_accession("ERR1", backend="numpy")
+
+    assert len(session.calls) == 1
+    assert second.equals(first)
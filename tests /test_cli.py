@@ -0,0 +1,18 @@
+import pytest
+
+import biodownloader.cli as cli
+
+
+@pytest.mark.parametrize("argv", [
+    ["--out", "meta.parquet"],
+    ["--out", "meta.csv", "--format", "parquet"],
+])
+def test_parquet_without_pyarrow_is_a_usage_error(monkeypatch, capsys, argv):
+    monkeypatch.setattr(cli, "HAVE_PYARROW", False)
+    monkeypatch.setattr(cli, "fetch_geo_series", lambda *a, **k: pytest.fail("fetched anyway"))
+
+    with pytest.raises(SystemExit) as exc:
+        cli.main(["--source", "geo", "--id", "GSE1", *argv])
+
+    assert exc.value.code == 2
+    assert "--format parquet requires pyarrow" in capsys.readouterr().err
@@ -0,0 +1,91 @@
+import pandas as pd
+import pytest
+
+import biodownloader.ena as ena
+
+
+@pytest.mark.parametrize("use_polars", [True, False])
+def test_late_alphanumeric_value_keeps_column_as_text(fake_session, monkeypatch, use_polars):
+    if not use_polars:
+        monkeypatch.setattr(ena, "pl", None)
+    elif ena.pl is None:
+        pytest.skip("polars not installed")
+
+    rows = "".join(f"SRR{i}\t{i}\n" for i in range(10_001))
+    body = ("run_accession\tsample_alias\n" + rows + "SRRX\tabc\n").encode()
+    fake_session(ena, body)
+
+    df = ena._ena_query("accession=PRJNA1", cache=False, backend="numpy")
+
+    assert len(df) == 10_002
+    assert df["sample_alias"].iloc[-1] == "abc"
+
+
+def test_polars_without_pyarrow_falls_back_to_pandas(fake_session, monkeypatch):
+    if ena.pl is None:
+        pytest.skip("polars not installed")
+    monkeypatch.setattr(ena, "HAVE_PYARROW", False)
+    monkeypatch.setattr(ena.pl, "read_csv", lambda *a, **k: pytest.fail("used polars"))
+    fake_session(ena, b"run_accession\tdescription\nERR1\tfoo\n")
+
+    df = ena._ena_query("accession=PRJEB1", cache=False, backend="numpy")
+
+    assert df["run_accession"].tolist() == ["ERR1"]
+
+
+@pytest.mark.parametrize("use_polars", [True, False])
+def test_missing_value_markers_become_nan(fake_session, monkeypatch, use_polars):
+    if not use_polars:
+        monkeypatch.setattr(ena, "pl", None)
+    elif ena.pl is None:
+        pytest.skip("polars not installed")
+
+    body = b"run_accession\tsample_alias\tread_count\n" \
+           b"SRR1\tNA\t1\nSRR2\tN/A\tnan\nSRR3\tnull\t3\nSRR4\tx\tNA\n"
+    fake_session(ena, body)
+
+    df = ena._ena_query("accession=PRJNA1", cache=False, backend="numpy")
+
+    assert df["sample_alias"].isna().tolist() == [True, True, True, False]
+    assert df["read_count"].isna().tolist() == [False, True, False, True]
+    assert pd.api.types.is_numeric_dtype(df["read_count"])
+
+
+def test_na_markers_match_pandas_defaults():
+    parsers = pytest.importorskip("pandas._libs.parsers")
+    from biodownloader._backend import PANDAS_NA_VALUES
+
+    assert set(PANDAS_NA_VALUES) == set(parsers.STR_NA_VALUES)
+
+
+def test_run_accession_is_queried_by_run_only(fake_session):
+    session = fake_session(ena, b"run_accession\tsample_accession\nSRR1\tSRS1\n")
+
+    df = ena.fetch_ena_accession("SRR1", cache=False, backend="numpy")
+
+    assert df["run_accession"].tolist() == ["SRR1"]
+    assert [call["params"]["query"] for call in session.calls] == ["run_accession=SRR1"]
+
+
+def test_empty_run_lookup_falls_back_to_accession(fake_session):
+    session = fake_session(
+        ena,
+        b"run_accession\tsample_accession\n",
+        b"run_accession\tsample_accession\nERR2\tERS2\n",
+    )
+
+    df = ena.fetch_ena_accession("ERR1", cache=False, backend="numpy")
+
+    assert df["run_accession"].tolist() == ["ERR2"]
+    assert [call["params"]["query"] for call in session.calls] == [
+        "run_accession=ERR1",
+        "accession=ERR1",
+    ]
+
+
+def test_non_run_accession_skips_run_lookup(fake_session):
+    session = fake_session(ena, b"run_accession\tsample_accession\nERR2\tERS2\n")
+
+    ena.fetch_ena_accession("PRJEB1", cache=False, backend="numpy")
+
+    assert [call["params"]["query"] for call in session.calls] == ["accession=PRJEB1"]
@@ -0,0 +1,76 @@
+import pytest
+
+from biodownloader.geo import _parse_geo_soft_quick, _read_soft_bytes
+
+SOFT = (
+    "^SERIES = GSE1\n"
+    "!Series_title = test series\n"
+    "^SAMPLE = GSM11\n"
+    "!Sample_title = café sample\n"
+    "!Sample_organism_ch1 = Homo sapiens\n"
+    "!Sample_source_name_ch1 = blood\n"
+    "!Sample_characteristics_ch1 = age: 1\n"
+    "!Sample_characteristics_ch1 = sex: M\n"
+    "^SAMPLE = GSM12\n"
+    "!Sample_title = b\n"
+    "!Sample_organism_ch1 = Homo sapiens\n"
+    "^SAMPLE = GSM13\n"
+    "!Sample_title = c\n"
+    "!Sample_organism_ch1 = Mus musculus\n"
+    "!Sample_source_name_ch1 = liver\n"
+).encode("utf-8")
+
+
+def test_parse_fields():
+    df = _parse_geo_soft_quick(SOFT, gse_id="GSE1")
+
+    assert list(df.columns) == ["GSE", "GSM", "title", "organism", "source_name", "characteristics"]
+    assert df["GSM"].tolist() == ["GSM11", "GSM12", "GSM13"]
+    assert df["GSE"].tolist() == ["GSE1"] * 3
+    assert df["title"].tolist() == ["café sample", "b", "c"]
+    assert df["characteristics"].tolist() == ["age: 1; sex: M", "", ""]
+    assert df["source_name"].tolist() == ["blood", "", "liver"]
+
+
+def test_parse_crlf_line_endings():
+    df = _parse_geo_soft_quick(SOFT.replace(b"\n", b"\r\n"), gse_id="GSE1")
+
+    assert df.equals(_parse_geo_soft_quick(SOFT, gse_id="GSE1"))
+
+
+@pytest.mark.parametrize("limit, expected", [
+    (None, ["GSM11", "GSM12", "GSM13"]),
+    (0, []),
+    (1, ["GSM11"]),
+    (10, ["GSM11", "GSM12", "GSM13"]),
+])
+def test_parse_limit(limit, expected):
+    df = _parse_geo_soft_quick(SOFT, gse_id="GSE1", limit=limit)
+
+    # no sample may be appended twice when the limit stops the loop
+    assert df["GSM"].tolist() == expected
+    assert len(df) == len(expected)
+
+
+class _ChunkedResponse:
+    def __init__(self, chunks):
+        self.chunks = chunks
+        self.consumed = 0
+
+    def iter_content(self, chunk_size=1):
+        for chunk in self.chunks:
+            self.consumed += 1
+            yield chunk
+
+
+def test_read_soft_bytes_counts_marker_split_across_chunks():
+    cut = SOFT.index(b"\n^SAMPLE = GSM12") + 4  # split inside "\n^SAMPLE"
+    rest = SOFT.index(b"\n^SAMPLE = GSM13")
+    resp = _ChunkedResponse([SOFT[:cut], SOFT[cut:rest], SOFT[rest:], b"never read"])
+
+    raw = _read_soft_bytes(resp, limit=1)
+
+    # the second marker (split across chunks 1 and 2) ends the read
+    assert resp.consumed == 2
+    assert raw == SOFT[:rest]
+    assert _parse_geo_soft_quick(raw, gse_id="GSE1", limit=1)["GSM"].tolist() == ["GSM11"]
@@ -0,0 +1,88 @@
+import gzip
+import io
+
+import pytest
+import requests
+
+import biodownloader._http as _http
+from conftest import make_response
+
+BODY = b"Run,SampleName\nSRR1,GSM1\n" * 100
+
+
+def test_small_uncompressed_body_is_streamed():
+    resp = make_response(BODY, headers={"Content-Length": str(len(BODY))})
+
+    with _http.open_body(resp) as body:
+        assert isinstance(body, io.BufferedReader)
+        assert body.read() == BODY
+
+
+def test_gzip_body_is_sized_on_decoded_bytes(monkeypatch):
+    # the compressed size is far below the threshold, the decoded size is not
+    monkeypatch.setattr(_http, "SPOOL_THRESHOLD", len(BODY) // 2)
+    wire = gzip.compress(BODY)
+    assert len(wire) < _http.SPOOL_THRESHOLD
+    resp = make_response(wire, headers={"Content-Length": str(len(wire)), "Content-Encoding": "gzip"})
+
+    with _http.open_body(resp) as body:
+        assert body._rolled  # spooled to disk
+        assert body.read() == BODY
+
+
+def test_unknown_size_body_stays_in_memory_below_threshold():
+    resp = make_response(BODY)
+
+    with _http.open_body(resp) as body:
+        assert not body._rolled
+        assert body.read() == BODY
+
+
+def test_empty_body_yields_none():
+    for headers in ({"Content-Length": "0"}, {}):
+        with _http.open_body(make_response(b"", headers=headers)) as body:
+            assert body is None
+
+
+@pytest.mark.parametrize("payload", [b"\n", b"  \n", b"\r\n\t\n"])
+@pytest.mark.parametrize("sized", [True, False])
+def test_whitespace_body_yields_none(payload, sized):
+    headers = {"Content-Length": str(len(payload))} if sized else {}
+    with _http.open_body(make_response(payload, headers=headers)) as body:
+        assert body is None
+
+
+def test_leading_blank_lines_are_kept_before_data():
+    payload = b"\n" * 10000 + b"Run\nSRR1\n"
+    for headers in ({"Content-Length": str(len(payload))}, {}):
+        with _http.open_body(make_response(payload, headers=headers)) as body:
+            assert body.read().strip() == b"Run\nSRR1"
+
+
+def test_session_is_reused_across_merge_calls(monkeypatch):
+    from biodownloader.integrate import fetch_and_merge_geo_sra
+
+    replies = {
+        "acc.cgi": b"^SERIES = GSE1\n^SAMPLE = GSM1\n!Sample_title = a\n",
+        "esearch.fcgi": (
+            b"<eSearchResult><Count>1</Count><QueryKey>1</QueryKey>"
+            b"<WebEnv>W</WebEnv></eSearchResult>"
+        ),
+        "efetch.fcgi": b"Run,SampleName\nSRR1,GSM1\n",
+    }
+    used = []
+
+    def get(self, url, **kwargs):
+        used.append(self)
+        body = next(v for k, v in replies.items() if k in url)
+        return make_response(body, headers={"Content-Length": str(len(body))})
+
+    monkeypatch.setattr(requests.Session, "get", get)
+
+    for _ in range(2):
+        merged = fetch_and_merge_geo_sra("GSE1", "PRJNA1", cache=False, backend="numpy")
+        assert merged["Run"].tolist() == ["SRR1"]
+
+    # both workers of both calls went through the one pooled session
+    assert len(used) == 6
+    assert all(session is _http.SESSION for session in used)
@@ -0,0 +1,70 @@
+import numpy as np
+import pandas as pd
+
+from biodownloader.integrate import merge_geo_sra
+
+
+def _tables():
+    geo = pd.DataFrame({
+        "GSE": ["GSE1"] * 4,
+        "GSM": ["GSM1", "GSM2", "ctrl", np.nan],
+        "title": ["a", "b", "c", "d"],
+    })
+    sra = pd.DataFrame({
+        "Run": ["SRR1", "SRR2", "SRR3", "SRR4"],
+        "SampleName": ["GSM1: patient_42", "ctrl", np.nan, "GSM9"],
+    })
+    return geo, sra
+
+
+def test_noisy_sample_name_matches_on_gsm():
+    geo, sra = _tables()
+
+    merged = merge_geo_sra(geo, sra, geo_gsm_col="GSM", sra_gsm_col="SampleName")
+
+    # GSM1 matches through the extracted ID, "ctrl" as-is, the NaN keys never match
+    assert merged[["GSM", "Run"]].values.tolist() == [["GSM1", "SRR1"], ["ctrl", "SRR2"]]
+    assert merged["SampleName"].tolist() == ["GSM1: patient_42", "ctrl"]
+    assert "_gsm_key" not in merged.columns
+
+
+def test_missing_keys_are_kept_unmatched_in_outer_merge():
+    geo, sra = _tables()
+
+    merged = merge_geo_sra(geo, sra, how="outer", geo_gsm_col="GSM", sra_gsm_col="SampleName")
+
+    assert len(merged) == 6
+    assert merged.loc[merged["title"] == "d", "Run"].isna().all()
+    assert merged.loc[merged["Run"] == "SRR3", "title"].isna().all()
+
+
+def test_shared_key_column_name_is_returned_once():
+    geo, sra = _tables()
+    sra = sra.rename(columns={"SampleName": "GSM"})
+
+    merged = merge_geo_sra(geo, sra, how="outer", geo_gsm_col="GSM", sra_gsm_col="GSM")
+
+    assert "GSM_geo" not in merged.columns and "GSM_sra" not in merged.columns
+    assert list(merged.columns[:2]) == ["GSE", "GSM"]
+    assert set(merged["GSM"].dropna()) == {"GSM1", "GSM2", "ctrl", "GSM9"}
+
+
+def test_detected_columns_match_explicit_ones():
+    geo, sra = _tables()
+
+    detected = merge_geo_sra(geo, sra)
+    explicit = merge_geo_sra(geo, sra, geo_gsm_col="GSM", sra_gsm_col="SampleName")
+
+    assert detected.equals(explicit)
+
+
+def test_numeric_keys_match_across_int_and_float():
+    geo = pd.DataFrame({"sample": [1, 2], "title": ["a", "b"]})
+    sra = pd.DataFrame({"sample": [1.0, np.nan], "Run": ["SRR1", "SRR2"]})
+
+    merged = merge_geo_sra(geo, sra, how="outer", geo_gsm_col="sample", sra_gsm_col="sample")
+
+    assert len(merged) == 3
+    matched = merged[merged["title"].eq("a")]
+    assert matched["Run"].tolist() == ["SRR1"]
+    assert merged["Run"].isna().sum() == 1